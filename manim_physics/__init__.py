@@ -1,12 +1,60 @@
 __version__ = "0.4.0"
 
+import importlib as _importlib
+
 from manim import *
 
-from .electromagnetism.electrostatics import *
-from .electromagnetism.magnetostatics import *
-from .optics.lenses import *
-from .optics.rays import *
-from .rigid_mechanics.pendulum import *
-from .rigid_mechanics.rigid_mechanics import *
-from .rigid_mechanics.harmonic import *
-from .wave import *
+# Map each public name to the submodule that defines it so the heavy
+# physics modules (and their pymunk/shapely imports) only load when a
+# name is first accessed (PEP 562).
+_NAME_MAP = {
+    "Charge": "manim_physics.electromagnetism.electrostatics",
+    "ElectricField": "manim_physics.electromagnetism.electrostatics",
+    "Wire": "manim_physics.electromagnetism.magnetostatics",
+    "MagneticField": "manim_physics.electromagnetism.magnetostatics",
+    "Lens": "manim_physics.optics.lenses",
+    "Ray": "manim_physics.optics.rays",
+    "Pendulum": "manim_physics.rigid_mechanics.pendulum",
+    "MultiPendulum": "manim_physics.rigid_mechanics.pendulum",
+    "Space": "manim_physics.rigid_mechanics.rigid_mechanics",
+    "SpaceScene": "manim_physics.rigid_mechanics.rigid_mechanics",
+    "_step": "manim_physics.rigid_mechanics.rigid_mechanics",
+    "_simulate": "manim_physics.rigid_mechanics.rigid_mechanics",
+    "get_shape": "manim_physics.rigid_mechanics.rigid_mechanics",
+    "get_angle": "manim_physics.rigid_mechanics.rigid_mechanics",
+    "SpringBlockOscillator": "manim_physics.rigid_mechanics.harmonic",
+    "SpringBlockOscillatorGroup": "manim_physics.rigid_mechanics.harmonic",
+    "LinearWave": "manim_physics.wave",
+    "RadialWave": "manim_physics.wave",
+    "StandingWave": "manim_physics.wave",
+}
+
+# The star-imports also used to bind the submodules themselves as
+# package attributes (manim_physics.wave etc.); keep that working.
+_SUBMODULES = {
+    "electromagnetism": "manim_physics.electromagnetism",
+    "optics": "manim_physics.optics",
+    "rigid_mechanics": "manim_physics.rigid_mechanics",
+    "wave": "manim_physics.wave",
+}
+
+__all__ = [name for name in globals() if not name.startswith("_")] + [
+    name for name in _NAME_MAP if not name.startswith("_")
+]
+
+
+def __getattr__(name):
+    module = _SUBMODULES.get(name)
+    if module is not None:
+        value = _importlib.import_module(module)
+    else:
+        module = _NAME_MAP.get(name)
+        if module is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_NAME_MAP) | set(_SUBMODULES))
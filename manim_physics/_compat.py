@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from enum import Enum
 from typing import Any
 
@@ -18,25 +19,30 @@ except ImportError:  # pragma: no cover - fallback for very old releases
 RendererType = _RendererType
 """Public alias for the renderer enum used by Manim."""
 
+_RENDERER_BY_VALUE = {rt.value: rt for rt in RendererType}
 
-def get_renderer_type(renderer: Any | None = None) -> RendererType:
-    """Return the :class:`RendererType` for ``renderer`` or the current config."""
 
-    value = config.renderer if renderer is None else renderer
+@functools.lru_cache(maxsize=32)
+def _resolve(value: Any) -> RendererType:
     if isinstance(value, RendererType):
         return value
-    try:
-        return RendererType(value)
-    except Exception:  # pragma: no cover - defensive fallback
-        if str(value).lower() == RendererType.OPENGL.value:
-            return RendererType.OPENGL
-        return RendererType.CAIRO
+    rt = _RENDERER_BY_VALUE.get(value)
+    if rt is None:  # pragma: no cover - defensive fallback
+        rt = _RENDERER_BY_VALUE.get(str(value).lower(), RendererType.CAIRO)
+    return rt
+
+
+def get_renderer_type(renderer: Any | None = None) -> RendererType:
+    """Return the :class:`RendererType` for ``renderer`` or the current config."""
+
+    return _resolve(config.renderer if renderer is None else renderer)
 
 
 def is_opengl_renderer(renderer: Any | None = None) -> bool:
     """Whether the given (or current) renderer corresponds to OpenGL."""
 
-    return get_renderer_type(renderer) == RendererType.OPENGL
+    value = config.renderer if renderer is None else renderer
+    return _resolve(value) == RendererType.OPENGL
 
 
 __all__ = ["RendererType", "get_renderer_type", "is_opengl_renderer"]
@@ -2,19 +2,46 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Optional
 
-from manim.constants import LEFT, RIGHT, UP
+from manim.constants import DOWN, LEFT, RIGHT, UP
 from manim.mobject.geometry.line import Line
 from manim.mobject.geometry.polygram import Rectangle
 from manim.mobject.types.vectorized_mobject import VMobject, VGroup
 import numpy as np
 import pymunk
+from pymunk import Vec2d
 
+from .._compat import is_opengl_renderer
 from .rigid_mechanics import SpaceScene
 
-__all__ = ["SpringBlockOscillator"]
+try:  # pragma: no cover - numba is an optional accelerator
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover - plain NumPy fallback below
+    _njit = None
+
+__all__ = ["SpringBlockOscillator", "SpringBlockOscillatorGroup"]
+
+
+if _njit is not None:
+
+    @_njit(cache=True, fastmath=True)
+    def _fill_spring_points(out, anchor, axis, normal, ts, sines):
+        """Write the spring polyline into ``out`` without temporaries."""
+        for i in range(ts.shape[0]):
+            out[i, 0] = anchor[0] + axis[0] * ts[i] + normal[0] * sines[i]
+            out[i, 1] = anchor[1] + axis[1] * ts[i] + normal[1] * sines[i]
+            out[i, 2] = anchor[2] + axis[2] * ts[i] + normal[2] * sines[i]
+
+else:
+
+    def _fill_spring_points(out, anchor, axis, normal, ts, sines):
+        """Write the spring polyline into ``out`` via NumPy broadcasting."""
+        np.outer(ts, axis, out=out)
+        out += np.outer(sines, normal)
+        out += anchor[None, :]
 
 
 @dataclass
@@ -25,6 +52,7 @@ class SpringStyle:
     amplitude: float = 0.1
     stroke_width: float = 4
     color: Optional[str] = None
+    smooth: bool = False
 
 
 class SpringBlockOscillator(VGroup):
@@ -42,20 +70,45 @@ class SpringBlockOscillator(VGroup):
         block_style: dict | None = None,
         anchor_style: dict | None = None,
         animate_spring: bool = True,
+        analytical: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
 
+        if analytical and damping:
+            raise ValueError("analytical motion requires damping == 0")
+        self.analytical = analytical
         self.rest_length = rest_length
         self.stiffness = stiffness
         self.damping = damping
         self.block_mass = block_mass
         self.block_width, self.block_height = block_size
+        if self.block_width <= 0 or self.block_height <= 0:
+            raise ValueError("block_size dimensions must be positive")
+        self._density = self.block_mass / (self.block_width * self.block_height)
+        # Vec2d is immutable, so the local spring attachment on the block
+        # can be built once instead of on every updater call.
+        self._local_anchor_vec = Vec2d(-self.block_width / 2, 0)
         self.animate_spring = animate_spring
         self._spacescene: Optional[SpaceScene] = None
         self.spring_joint: Optional[pymunk.DampedSpring] = None
 
         self._spring_style = spring_style or SpringStyle()
+        # The sample positions and sine offsets only depend on the spring
+        # style, which is fixed after construction, so compute them once
+        # instead of on every updater call.
+        resolution = max(8 * self._spring_style.coils, 32)
+        self._spring_ts = np.linspace(0, 1, resolution)
+        self._spring_sines = (
+            np.sin(2 * np.pi * self._spring_style.coils * self._spring_ts)
+            * self._spring_style.amplitude
+        )
+        self._spring_buf = np.empty((resolution, 3))
+        # The OpenGL backend rasterizes strokes on the GPU, so the
+        # CPU-side Bezier smoothing is wasted work there even when
+        # requested.
+        self._use_smooth = self._spring_style.smooth and not is_opengl_renderer()
+        self._last_endpoints: tuple = (None, None)
         self._anchor_style = anchor_style or {}
         self._block_style = block_style or {}
 
@@ -76,49 +129,75 @@ class SpringBlockOscillator(VGroup):
             stroke_width=self._spring_style.stroke_width,
             color=self._spring_style.color,
         )
-        self._redraw_spring()
-
+        # Add the empty spring before filling it so the group only sees
+        # one invalidation pass instead of a redraw plus an add.
         self.add(self.anchor, self.spring, self.block)
+        self._redraw_spring()
 
         if self.animate_spring:
-            self.spring.add_updater(lambda mob: self._redraw_spring())
+            self.spring.add_updater(self._redraw_spring)
 
     # ------------------------------------------------------------------
     # Geometry helpers
     # ------------------------------------------------------------------
     def _get_anchor_point(self) -> np.ndarray:
-        return self.anchor.point_from_proportion(0.5)
+        # Averaging the endpoints tracks any later movement of the
+        # mobject (shift, arrange, animate) while staying far cheaper
+        # than walking the Bezier curves via point_from_proportion.
+        return (self.anchor.get_start() + self.anchor.get_end()) * 0.5
+
+    def _get_rest_center(self) -> np.ndarray:
+        return self._get_anchor_point() + RIGHT * (
+            self.rest_length + self.block_width / 2
+        )
 
     def _block_local_anchor(self) -> pymunk.Vec2d:
-        return pymunk.Vec2d(-self.block_width / 2, 0)
+        return self._local_anchor_vec
 
     def _block_anchor_point(self) -> np.ndarray:
         if hasattr(self.block, "body"):
-            offset = self._block_local_anchor().rotated(self.block.body.angle)
+            offset = self._local_anchor_vec.rotated(self.block.body.angle)
             pos = self.block.body.position + offset
             return np.array([pos.x, pos.y, 0.0])
         return self.block.get_center() + LEFT * self.block_width / 2
 
-    def _redraw_spring(self) -> None:
+    def _redraw_spring(self, mob: VMobject | None = None) -> None:
         anchor = self._get_anchor_point()
         block_point = self._block_anchor_point()
+        last_anchor, last_block = self._last_endpoints
+        if (
+            last_anchor is not None
+            and np.array_equal(anchor, last_anchor)
+            and np.array_equal(block_point, last_block)
+        ):
+            # Nothing moved (e.g. the body is sleeping); keep the
+            # existing polyline instead of rebuilding it.
+            return
         axis = block_point - anchor
-        length = np.linalg.norm(axis[:2])
-        if length == 0:
-            axis = RIGHT
-            length = 1
+        # math.sqrt on two scalars avoids the np.linalg.norm dispatch
+        # overhead, which dominates the actual arithmetic at this size.
+        # The epsilon keeps the division well defined when both endpoints
+        # coincide (a degenerate but well-typed result) without a branch
+        # that rebinds axis.
+        length = (
+            math.sqrt(
+                float(axis[0]) * float(axis[0]) + float(axis[1]) * float(axis[1])
+            )
+            or 1e-12
+        )
         direction = axis / length
         normal = np.array([-direction[1], direction[0], 0])
 
-        points = []
-        resolution = max(4 * self._spring_style.coils, 8)
-        ts = np.linspace(0, 1, resolution)
-        for t in ts:
-            sine = np.sin(2 * np.pi * self._spring_style.coils * t)
-            points.append(
-                anchor + axis * t + normal * sine * self._spring_style.amplitude
-            )
-        self.spring.set_points_smoothly(points)
+        _fill_spring_points(
+            self._spring_buf, anchor, axis, normal, self._spring_ts, self._spring_sines
+        )
+        if self._use_smooth:
+            self.spring.set_points_smoothly(self._spring_buf)
+        else:
+            # At this sampling density a polyline is indistinguishable
+            # from the smoothed curve and skips the Bezier fit per frame.
+            self.spring.set_points_as_corners(self._spring_buf)
+        self._last_endpoints = (anchor, block_point)
 
     # ------------------------------------------------------------------
     # Pymunk helpers
@@ -129,13 +208,17 @@ class SpringBlockOscillator(VGroup):
         self._spacescene = scene
         scene.make_static_body(self.anchor)
 
-        block_area = self.block_width * self.block_height
-        density = self.block_mass / block_area if block_area else 1
-        scene.make_rigid_body(self.block, density=density)
+        if self.analytical:
+            # Closed-form motion: the block never enters the pymunk space.
+            return
+
+        scene.make_rigid_body(self.block, density=self._density)
 
         self._create_joint()
 
     def _create_joint(self) -> None:
+        if self.analytical:
+            return
         if not self._spacescene or not hasattr(self.block, "body"):
             return
         if self.spring_joint is not None:
@@ -164,21 +247,44 @@ class SpringBlockOscillator(VGroup):
         if not self._spacescene:
             raise RuntimeError("attach_to_scene must be called before starting motion")
 
+        if self.analytical:
+            # x(t) = A cos(omega t + phi) with x(0) = displacement and
+            # x'(0) = velocity; a few float ops per frame replace the
+            # iterative pymunk solve.
+            omega = math.sqrt(self.stiffness / self.block_mass)
+            self._analytic_omega = omega
+            self._analytic_amp = math.sqrt(
+                displacement * displacement + (velocity / omega) ** 2
+            )
+            self._analytic_phase = math.atan2(-velocity / omega, displacement)
+            self._analytic_t = 0.0
+            self.block.move_to(self._get_rest_center() + RIGHT * displacement)
+            self.block.remove_updater(self._advance_analytical)
+            self.block.add_updater(self._advance_analytical)
+            return
+
         self._create_joint()
-        rest_center = self._get_anchor_point() + RIGHT * (
-            self.rest_length + self.block_width / 2
-        )
-        new_center = rest_center + RIGHT * displacement
+        new_center = self._get_rest_center() + RIGHT * displacement
 
-        self.block.body.position = (new_center[0], new_center[1])
-        self.block.body.velocity = (velocity, 0)
+        self.block.body.position = Vec2d(float(new_center[0]), float(new_center[1]))
+        self.block.body.velocity = Vec2d(velocity, 0)
         self.block.body.angular_velocity = 0
         self.block.body.angle = 0
         self.block.body.activate()
 
+    def _advance_analytical(self, mob: VMobject, dt: float) -> None:
+        self._analytic_t += dt
+        x = self._analytic_amp * math.cos(
+            self._analytic_omega * self._analytic_t + self._analytic_phase
+        )
+        mob.move_to(self._get_rest_center() + RIGHT * x)
+
     def stop_oscillation(self) -> None:
         """Detach the block from the spring and let it rest."""
 
+        if self.analytical:
+            self.block.remove_updater(self._advance_analytical)
+            return
         if not self._spacescene:
             return
         if self.spring_joint is not None:
@@ -190,12 +296,85 @@ class SpringBlockOscillator(VGroup):
     def reset_displacement(self) -> None:
         """Return the oscillator to the rest position and zero velocity."""
 
+        if self.analytical:
+            self.block.remove_updater(self._advance_analytical)
+            self.block.move_to(self._get_rest_center())
+            return
         if not hasattr(self.block, "body"):
             return
-        rest_center = self._get_anchor_point() + RIGHT * (
-            self.rest_length + self.block_width / 2
-        )
-        self.block.body.position = (rest_center[0], rest_center[1])
-        self.block.body.velocity = (0, 0)
+        rest_center = self._get_rest_center()
+        self.block.body.position = Vec2d(float(rest_center[0]), float(rest_center[1]))
+        self.block.body.velocity = Vec2d(0, 0)
         self.block.body.angular_velocity = 0
         self.block.body.angle = 0
+
+
+class SpringBlockOscillatorGroup(VGroup):
+    """A collection of oscillators whose springs are redrawn in one pass.
+
+    Each :class:`SpringBlockOscillator` normally rebuilds its spring in
+    its own per-frame updater. For scenes with many oscillators this
+    group strips those updaters and instead gathers every endpoint into
+    contiguous arrays, computing all spring polylines with a single
+    vectorized call per frame.
+    """
+
+    def __init__(self, *oscillators: SpringBlockOscillator, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.oscillators = list(oscillators)
+        # Only members that asked for spring animation take part in the
+        # batched redraw; animate_spring=False stays still in a group too.
+        self._animated = []
+        for osc in self.oscillators:
+            if osc.animate_spring:
+                osc.spring.remove_updater(osc._redraw_spring)
+                self._animated.append(osc)
+            self.add(osc)
+
+        n = len(self._animated)
+        resolution = max(
+            (osc._spring_ts.shape[0] for osc in self._animated), default=0
+        )
+        self._ts = np.linspace(0, 1, resolution) if resolution else None
+        if n:
+            self._sines = np.empty((n, resolution))
+            for i, osc in enumerate(self._animated):
+                style = osc._spring_style
+                self._sines[i] = (
+                    np.sin(2 * np.pi * style.coils * self._ts) * style.amplitude
+                )
+            self._anchors = np.empty((n, 3))
+            self._block_points = np.empty((n, 3))
+            self.add_updater(self._redraw_all)
+
+    def _redraw_all(self, mob: VMobject | None = None) -> None:
+        for i, osc in enumerate(self._animated):
+            self._anchors[i] = osc._get_anchor_point()
+            self._block_points[i] = osc._block_anchor_point()
+
+        axes = self._block_points - self._anchors
+        lengths = np.sqrt(axes[:, 0] ** 2 + axes[:, 1] ** 2)
+        lengths[lengths == 0] = 1e-12
+        directions = axes / lengths[:, None]
+        normals = np.empty_like(axes)
+        normals[:, 0] = -directions[:, 1]
+        normals[:, 1] = directions[:, 0]
+        normals[:, 2] = 0
+
+        points = (
+            self._anchors[:, None, :]
+            + self._ts[None, :, None] * axes[:, None, :]
+            + self._sines[:, :, None] * normals[:, None, :]
+        )
+        for osc, rows in zip(self._animated, points):
+            if osc._use_smooth:
+                osc.spring.set_points_smoothly(rows)
+            else:
+                osc.spring.set_points_as_corners(rows)
+
+    def attach_to_scene(self, scene: SpaceScene) -> None:
+        """Register every oscillator with a :class:`SpaceScene`."""
+
+        for osc in self.oscillators:
+            osc.attach_to_scene(scene)
@@ -0,0 +1,34 @@
+import pytest
+
+from manim_physics.rigid_mechanics.harmonic import (
+    SpringBlockOscillator,
+    SpringBlockOscillatorGroup,
+)
+
+
+def test_group_takes_over_member_updaters():
+    oscillators = [SpringBlockOscillator() for _ in range(2)]
+    group = SpringBlockOscillatorGroup(*oscillators)
+    for osc in oscillators:
+        assert osc._redraw_spring not in osc.spring.updaters
+    assert group._redraw_all in group.updaters
+
+
+def test_group_respects_animate_spring():
+    animated = SpringBlockOscillator()
+    still = SpringBlockOscillator(animate_spring=False)
+    group = SpringBlockOscillatorGroup(animated, still)
+    assert animated in group._animated
+    assert still not in group._animated
+
+
+def test_analytical_rejects_damping():
+    with pytest.raises(ValueError):
+        SpringBlockOscillator(analytical=True)
+    SpringBlockOscillator(analytical=True, damping=0)
+
+
+def test_lazy_import_resolves_group():
+    import manim_physics
+
+    assert manim_physics.SpringBlockOscillatorGroup is SpringBlockOscillatorGroup